@@ -1,5 +1,12 @@
 from gdeltdoc.api_client import GdeltDoc
 from gdeltdoc.filters import Filters, near, repeat, multi_repeat, VALID_TIMESPAN_UNITS
+from gdeltdoc.errors import (
+    BadRequestError,
+    NotFoundError,
+    RateLimitError,
+    ClientRequestError,
+    ServerError,
+)
 from gdeltdoc._version import version
 
 __version__ = version
@@ -1,14 +1,56 @@
 import requests
-import pandas as pd
+
+import random
+import sys
+
+from collections import OrderedDict
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from operator import itemgetter
+from threading import Lock
+from urllib.parse import quote, urlencode
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from gdeltdoc.filters import Filters
 
-from typing import Dict
+from typing import Dict, List, Optional, Union, TYPE_CHECKING
 
-from gdeltdoc.helpers import load_json
+from gdeltdoc.errors import raise_response_error
+from gdeltdoc.helpers import load_article_columns, load_json
 
 from gdeltdoc._version import version
 
+if TYPE_CHECKING:
+    # pandas and numpy are slow to import, so only load them when a DataFrame is built
+    import pandas as pd
+
+API_URL = "https://api.gdeltproject.org/api/v2/doc/doc"
+
+# The most connections to the API the client keeps open at once
+_POOL_MAXSIZE = 16
+
+_SUPPORTED_MODES = frozenset(map(sys.intern, [
+    "artlist",
+    "timelinevol",
+    "timelinevolraw",
+    "timelinetone",
+    "timelinelang",
+    "timelinesourcecountry",
+]))
+
+
+class _JitteredRetry(Retry):
+    """
+    A `Retry` which adds random jitter to its exponential backoff, so that clients
+    which were rate limited at the same time don't all retry at the same time.
+    """
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        return backoff + random.uniform(0, backoff)
+
+
 class GdeltDoc:
     """
     API client for the GDELT 2.0 Doc API
@@ -29,12 +71,19 @@ class GdeltDoc:
 
     # Get a timeline of the number of articles matching the filters
     timeline = gd.timeline_search("timelinevol", f)
+
+    # Search for articles matching several sets of filters at once
+    many_articles = gd.article_search_many([f, other_filters])
     ```
 
+    The client keeps a pool of open connections to the API between queries. Use it as a
+    context manager (`with GdeltDoc() as gd:`) or call `gd.close()` to release them.
+
     ### Article List
     The article list mode of the API generates a list of news articles that match the filters.
     The client returns this as a pandas DataFrame with columns `url`, `url_mobile`, `title`,
-    `seendate`, `socialimage`, `domain`, `language`, `sourcecountry`.
+    `seendate`, `socialimage`, `domain`, `language`, `sourcecountry`. `seendate` is parsed
+    into a UTC datetime.
 
     ### Timeline Search
     There are 5 available modes when making a timeline search:
@@ -51,17 +100,79 @@ class GdeltDoc:
         for more information about the tone metric.
     """
 
-    def __init__(self, json_parsing_max_depth: int = 100) -> None:
+    def __init__(
+        self,
+        json_parsing_max_depth: int = 100,
+        timeout: Optional[float] = 60,
+        cache_size: int = 256,
+        max_retries: int = 5,
+    ) -> None:
         """
         Params
         ------
         json_parsing_max_depth
             A parameter for the json parsing function that removes illegal character. If 100 it will remove at max
             100 characters before exiting with an exception
+
+        timeout
+            How many seconds to wait for the API to respond before giving up. Pass `None` to wait forever.
+
+        cache_size
+            The number of API responses to keep in memory. Repeating a query that's in the cache
+            returns the stored response instead of calling the API again. Only queries with a
+            start and end date are cached, a relative `timespan` always calls the API so it sees
+            new articles. Pass 0 to disable caching.
+
+        max_retries
+            How many times to retry a query when the API is rate limiting requests, has a temporary
+            error or can't be reached. Retries back off exponentially and respect the API's
+            `Retry-After` header. Pass 0 to disable retries.
         """
         self.max_depth_json_parsing = json_parsing_max_depth
+        self.timeout = timeout
+        self.cache_size = cache_size
+
+        # Raw response bodies keyed by their encoded URL parameters, least recently used first
+        self._cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._cache_lock = Lock()
+
+        # Reuse one connection pool across queries so consecutive calls skip the TCP and TLS handshakes
+        self._session = requests.Session()
+        retry = _JitteredRetry(
+            total=max_retries,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+            # Let `raise_response_error` report the final failed response
+            raise_on_status=False,
+        )
+        self._session.mount(
+            "https://", HTTPAdapter(pool_connections=4, pool_maxsize=_POOL_MAXSIZE, max_retries=retry)
+        )
+        self._session.headers["User-Agent"] = (
+            f"GDELT DOC Python API client {version} - https://github.com/alex9smith/gdelt-doc-api"
+        )
+
+    def __enter__(self) -> "GdeltDoc":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the underlying HTTP session and release its pooled connections.
+        """
+        self._session.close()
+
+    def clear_cache(self) -> None:
+        """
+        Forget all cached API responses, so the next query for each filter calls the API again.
+        """
+        with self._cache_lock:
+            self._cache.clear()
 
-    def article_search(self, filters: Filters) -> pd.DataFrame:
+    def article_search(self, filters: Filters) -> "pd.DataFrame":
         """
         Make a query against the `ArtList` API to return a DataFrame of news articles that
         match the supplied filters.
@@ -76,13 +187,71 @@ class GdeltDoc:
         pd.DataFrame
             A pandas DataFrame of the articles returned from the API.
         """
-        articles = self._query("artlist", filters.query_string)
-        if "articles" in articles:
-            return pd.DataFrame(articles["articles"])
+        import pandas as pd
+
+        # The schema is fixed, so build each column directly rather than letting pandas infer it
+        results = load_article_columns(self._request("artlist", filters.params), self.max_depth_json_parsing)
+        if results is not None:
+            results["seendate"] = pd.to_datetime(
+                results["seendate"], format="%Y%m%dT%H%M%S%z", utc=True, cache=True
+            )
+            return pd.DataFrame(results, copy=False)
         else:
             return pd.DataFrame()
 
-    def timeline_search(self, mode: str, filters: Filters) -> pd.DataFrame:
+    def article_search_many(
+        self,
+        filters_list: List[Filters],
+        concurrency: int = 4,
+        return_exceptions: bool = False,
+    ) -> List[Union["pd.DataFrame", Exception]]:
+        """
+        Make several article searches at once, with up to `concurrency` requests to the API in flight
+        at the same time.
+
+        Params
+        ------
+        filters_list
+            A list of `gdelt-doc.Filters` objects, one per query.
+
+        concurrency
+            The maximum number of queries to make at the same time. Keep this small, the API
+            rate limits clients that make too many requests. Values above the size of the client's
+            connection pool (16) are capped to it.
+
+        return_exceptions
+            If False, the first query to fail raises its exception, the queries that haven't
+            started yet are cancelled and the results of every other query are lost. If True,
+            a failed query's exception is returned in its place in the results instead, so the
+            other queries' results are kept.
+
+        Returns
+        -------
+        List[Union[pd.DataFrame, Exception]]
+            A DataFrame of articles for each of the filters, in the same order as `filters_list`.
+            Only contains exceptions if `return_exceptions` is True.
+        """
+        with ThreadPoolExecutor(max_workers=min(concurrency, _POOL_MAXSIZE)) as executor:
+            futures = [executor.submit(self.article_search, filters) for filters in filters_list]
+
+            if not return_exceptions:
+                # Don't make the queued queries once one has failed, the API may be rate limiting us.
+                # Queries start in order, so a cancelled query always comes after the failed one.
+                wait(futures, return_when=FIRST_EXCEPTION)
+                for future in futures:
+                    future.cancel()
+                return [future.result() for future in futures]
+
+            results: List[Union["pd.DataFrame", Exception]] = []
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    results.append(e)
+
+            return results
+
+    def timeline_search(self, mode: str, filters: Filters) -> "pd.DataFrame":
         """
         Make a query using one of the API's timeline modes.
 
@@ -103,24 +272,61 @@ class GdeltDoc:
         pd.DataFrame
             A pandas DataFrame of the articles returned from the API.
         """
-        timeline = self._query(mode, filters.query_string)
+        import numpy as np
+        import pandas as pd
 
-        results = {"datetime": [entry["date"] for entry in timeline["timeline"][0]["data"]]}
+        timeline = self._query(mode, filters.params)
 
-        for series in timeline["timeline"]:
-            results[series["series"]] = [entry["value"] for entry in series["data"]]
+        if not timeline.get("timeline"):
+            return pd.DataFrame()
 
-        if mode == "timelinevolraw":
-            results["All Articles"] = [
-                entry["norm"] for entry in timeline["timeline"][0]["data"]
-            ]
+        first, *others = timeline["timeline"]
+        n_rows = len(first["data"])
+        raw_volume = mode == "timelinevolraw"
+
+        def as_counts(values: "np.ndarray") -> "np.ndarray":
+            # Raw volumes are article counts, but keep them as floats if the API left any as null
+            return values if np.isnan(values).any() else values.astype(np.int64)
+
+        # Fill the dates, first series and (for raw volumes) the totals in one pass.
+        # Float arrays store nulls from the API as NaN.
+        dates = np.empty(n_rows, dtype=object)
+        values = np.empty(n_rows, dtype=np.float64)
+        if raw_volume:
+            all_articles = np.empty(n_rows, dtype=np.float64)
+            get_entry = itemgetter("date", "value", "norm")
+            for i, entry in enumerate(first["data"]):
+                dates[i], values[i], all_articles[i] = get_entry(entry)
+        else:
+            get_entry = itemgetter("date", "value")
+            for i, entry in enumerate(first["data"]):
+                dates[i], values[i] = get_entry(entry)
 
-        formatted = pd.DataFrame(results)
-        formatted["datetime"] = pd.to_datetime(formatted["datetime"])
+        results = {
+            "datetime": pd.to_datetime(dates, format="%Y%m%dT%H%M%S%z", cache=True),
+            first["series"]: as_counts(values) if raw_volume else values,
+        }
 
-        return formatted
+        get_value = itemgetter("value")
+        for series in others:
+            # Every series is stored against the first series' dates, so they must line up
+            if len(series["data"]) != n_rows:
+                raise ValueError(
+                    f"Series {series['series']} has {len(series['data'])} entries, "
+                    f"but {first['series']} has {n_rows}. All arrays must be of the same length"
+                )
 
-    def _query(self, mode: str, query_string: str) -> Dict:
+            values = np.empty(n_rows, dtype=np.float64)
+            for i, entry in enumerate(series["data"]):
+                values[i] = get_value(entry)
+            results[series["series"]] = as_counts(values) if raw_volume else values
+
+        if raw_volume:
+            results["All Articles"] = as_counts(all_articles)
+
+        return pd.DataFrame(results)
+
+    def _query(self, mode: str, params: Dict[str, str]) -> Dict:
         """
         Submit a query to the GDELT API and return the results as a parsed JSON object.
 
@@ -130,39 +336,80 @@ class GdeltDoc:
             The API mode to call. Must be one of "artlist", "timelinevol",
             "timelinevolraw", "timelinetone", "timelinelang", "timelinesourcecountry".
 
-        query_string
-            The query parameters and date range to call the API with.
+        params
+            The query parameters and date range to call the API with, usually `Filters.params`.
 
         Returns
         -------
         Dict
             The parsed JSON response from the API.
         """
-        if mode not in [
-            "artlist",
-            "timelinevol",
-            "timelinevolraw",
-            "timelinetone",
-            "timelinelang",
-            "timelinesourcecountry",
-        ]:
+        return load_json(self._request(mode, params), self.max_depth_json_parsing)
+
+    def _request(self, mode: str, params: Dict[str, str]) -> bytes:
+        """
+        Submit a query to the GDELT API and return the raw body of the response.
+
+        Params
+        ------
+        mode
+            The API mode to call. Must be one of "artlist", "timelinevol",
+            "timelinevolraw", "timelinetone", "timelinelang", "timelinesourcecountry".
+
+        params
+            The query parameters and date range to call the API with, usually `Filters.params`.
+
+        Returns
+        -------
+        bytes
+            The body of the API's response.
+        """
+        if mode not in _SUPPORTED_MODES:
             raise ValueError(f"Mode {mode} not in supported API modes")
 
-        headers = {
-            "User-Agent": f"GDELT DOC Python API client {version} - https://github.com/alex9smith/gdelt-doc-api"
-        }
+        # Encode spaces as %20 rather than +, matching the API's documented examples
+        encoded_params = urlencode({**params, "mode": mode, "format": "json"}, quote_via=quote)
 
-        response = requests.get(
-            f"https://api.gdeltproject.org/api/v2/doc/doc?query={query_string}&mode={mode}&format=json",
-            headers=headers
-        )
+        # A `timespan` is relative to now, so the same query returns new results over time
+        return self._fetch(encoded_params, cacheable="timespan" not in params)
+
+    def _fetch(self, encoded_params: str, cacheable: bool = True) -> bytes:
+        """
+        Return the raw body of the API's response to a query, from the cache if it's been made before.
+
+        Params
+        ------
+        encoded_params
+            The URL encoded query string to call the API with, including the mode and format.
+
+        cacheable
+            Whether the response can be stored in and read from the cache.
 
-        if response.status_code not in [200, 202]:
-            raise ValueError("The gdelt api returned a non-successful statuscode. This is the response message: {}".
-                             format(response.text))
+        Returns
+        -------
+        bytes
+            The body of the API's response.
+        """
+        cacheable = cacheable and self.cache_size > 0
+
+        if cacheable:
+            with self._cache_lock:
+                if encoded_params in self._cache:
+                    self._cache.move_to_end(encoded_params)
+                    return self._cache[encoded_params]
+
+        response = self._session.get(API_URL, params=encoded_params, timeout=self.timeout)
+
+        raise_response_error(response)
 
         # Response is text/html if it's an error and application/json if it's ok
         if "text/html" in response.headers["content-type"]:
             raise ValueError(f"The query was not valid. The API error message was: {response.text.strip()}")
 
-        return load_json(response.content, self.max_depth_json_parsing)
+        if cacheable:
+            with self._cache_lock:
+                self._cache[encoded_params] = response.content
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        return response.content
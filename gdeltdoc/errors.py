@@ -0,0 +1,61 @@
+from requests import Response
+
+
+class BadRequestError(ValueError):
+    """The API rejected the request as malformed (HTTP 400)."""
+
+
+class NotFoundError(ValueError):
+    """The API endpoint could not be found (HTTP 404)."""
+
+
+class RateLimitError(ValueError):
+    """Too many requests have been made to the API in a short time (HTTP 429)."""
+
+
+class ClientRequestError(ValueError):
+    """Any other 4xx error returned by the API."""
+
+
+class ServerError(ValueError):
+    """The API failed to handle the request (HTTP 5xx)."""
+
+
+_ERRORS_BY_STATUS = {
+    400: BadRequestError,
+    404: NotFoundError,
+    429: RateLimitError,
+}
+
+
+def raise_response_error(response: Response) -> None:
+    """
+    Raise an exception matching the status code of an unsuccessful API response.
+    Does nothing if the response was successful.
+
+    Params
+    ------
+    response
+        The response returned by the API.
+
+    Returns
+    -------
+    None
+    """
+    status = response.status_code
+
+    if status == 200 or status == 202:
+        return
+
+    error = _ERRORS_BY_STATUS.get(status)
+    if error is None:
+        if 400 <= status < 500:
+            error = ClientRequestError
+        elif 500 <= status < 600:
+            error = ServerError
+        else:
+            error = ValueError
+
+    raise error(
+        f"The gdelt api returned a non-successful statuscode. This is the response message: {response.text}"
+    )
@@ -1,9 +1,28 @@
-from typing import Optional, List, Union, Tuple
-from string import ascii_lowercase, digits
+import re
+import sys
+
+from datetime import date as _date
+from typing import Dict, Optional, List, Union, Tuple
+from string import ascii_lowercase
 
 Filter = Union[List[str], str]
 
 VALID_TIMESPAN_UNITS = ["min", "h", "hours", "d", "days", "w", "weeks", "m", "months"]
+_VALID_UNITS = frozenset(VALID_TIMESPAN_UNITS)
+_TIMESPAN_RE = re.compile(r"([0-9]+)(" + "|".join(VALID_TIMESPAN_UNITS) + ")")
+# YYYY-MM-DD or YYYYMMDD, either with both dashes or with neither
+_DATE_RE = re.compile(r"([0-9]{4})(-?)([0-9]{2})\2([0-9]{2})")
+_AND_OR = frozenset(("AND", "OR"))
+
+# Filter names used by the API
+_DOMAIN = sys.intern("domain")
+_DOMAINIS = sys.intern("domainis")
+_SOURCECOUNTRY = sys.intern("sourcecountry")
+_THEME = sys.intern("theme")
+
+# The "name:" prefix and " OR name:" separator for each filter name the API supports
+_FILTER_PREFIXES = {name: name + ":" for name in (_DOMAIN, _DOMAINIS, _SOURCECOUNTRY, _THEME)}
+_FILTER_SEPARATORS = {name: " OR " + prefix for name, prefix in _FILTER_PREFIXES.items()}
 
 def near(n: int, *args) -> str:
     """
@@ -16,7 +35,7 @@ def near(n: int, *args) -> str:
     if len(args) < 2:
         raise ValueError("At least two words must be provided")
 
-    return f"near{str(n)}:" + '"' + " ".join([a for a in args]) + '" '
+    return f'near{n}:"{" ".join(args)}" '
 
 
 def repeat(n: int, keyword: str) -> str:
@@ -31,7 +50,7 @@ def repeat(n: int, keyword: str) -> str:
     if " " in keyword:
         raise ValueError("Only single words can be repeated")
 
-    return f'repeat{str(n)}:"{keyword}" '
+    return f'repeat{n}:"{keyword}" '
 
 
 def multi_repeat(repeats: List[Tuple[int, str]], method: str) -> str:
@@ -46,18 +65,24 @@ def multi_repeat(repeats: List[Tuple[int, str]], method: str) -> str:
         repeats: A list of (int, str) tuples to be passed to `repeat()`. Eg. [(2, "airline"), (3, "airport")]
         method: How to combine the restrictions. Must be one of "AND" or "OR"
     """
-    if method not in ["AND", "OR"]:
+    if method not in _AND_OR:
         raise ValueError(f"method must be one of AND or OR, not {method}")
 
-    to_repeat = [repeat(n, keyword) for (n, keyword) in repeats]
+    if any(" " in keyword for (_, keyword) in repeats):
+        raise ValueError("Only single words can be repeated")
+
+    joined = f"{method} ".join(f'repeat{n}:"{keyword}" ' for (n, keyword) in repeats)
 
     if method == "AND":
-        return f"{method} ".join(to_repeat)
-    elif method == "OR":
-        return "(" + f"{method} ".join(to_repeat) + ")"
+        return joined
+    else:
+        return "(" + joined + ")"
 
 
 class Filters:
+    # Filters are created for every query, so skip the per-instance __dict__
+    __slots__ = ("query_params", "api_params", "_valid_countries", "_valid_themes", "_query_string")
+
     def __init__(
         self,
         start_date: Optional[str] = None,
@@ -125,58 +150,81 @@ class Filters:
             Return articles that cover one of GDELT's GKG Themes. A full list of themes can be
             found here: http://data.gdeltproject.org/api/v2/guides/LOOKUP-GKGTHEMES.TXT
         """
-        self.query_params: List[str] = []
-        self._valid_countries: List[str] = []
-        self._valid_themes: List[str] = []
+        # Do all the validation up front, before any of the query is built
+        if num_records > 250:
+            raise ValueError(f"num_records must 250 or less, not {num_records}")
 
         # Check we have either start/end date or timespan, but not both
-        if not start_date and not end_date and not timespan:
-            raise ValueError("Must provide either start_date and end_date, or timespan")
-
-        if start_date and end_date and timespan:
-            raise ValueError(
-                "Can only provide either start_date and end_date, or timespan"
-            )
-
-        if keyword:
-            self.query_params.append(self._keyword_to_string(keyword))
+        if start_date or end_date:
+            if timespan:
+                raise ValueError(
+                    "Can only provide either start_date and end_date, or timespan"
+                )
 
-        if domain:
-            self.query_params.append(self._filter_to_string("domain", domain))
+            if not (start_date and end_date):
+                raise ValueError("Must provide both start_date and end_date")
 
-        if domain_exact:
-            self.query_params.append(self._filter_to_string("domainis", domain_exact))
+            start = self._date_to_datetime(start_date)
+            end = self._date_to_datetime(end_date)
 
-        if country:
-            self.query_params.append(self._filter_to_string("sourcecountry", country))
+        elif timespan:
+            self._validate_timespan(timespan)
 
-        if theme:
-            self.query_params.append(self._filter_to_string("theme", theme))
+        else:
+            raise ValueError("Must provide either start_date and end_date, or timespan")
 
-        if near:
-            self.query_params.append(near)
+        # Fragments of the `query` search clause, and the other URL parameters sent alongside it
+        self.query_params: Tuple[str, ...] = tuple(
+            clause
+            for clause in (
+                self._keyword_to_string(keyword) if keyword else None,
+                self._filter_to_string(_DOMAIN, domain) if domain else None,
+                self._filter_to_string(_DOMAINIS, domain_exact) if domain_exact else None,
+                self._filter_to_string(_SOURCECOUNTRY, country) if country else None,
+                self._filter_to_string(_THEME, theme) if theme else None,
+                near,
+                repeat,
+            )
+            if clause
+        )
+        self.api_params: Dict[str, str]
+        self._valid_countries: List[str] = []
+        self._valid_themes: List[str] = []
 
-        if repeat:
-            self.query_params.append(repeat)
+        max_records = str(num_records)
 
         if start_date:
-            self.query_params.append(
-                f'&startdatetime={start_date.replace("-", "")}000000'
-            )
-            self.query_params.append(f'&enddatetime={end_date.replace("-", "")}000000')
+            self.api_params = {"startdatetime": start, "enddatetime": end, "maxrecords": max_records}
+            suffix = f"&startdatetime={start}&enddatetime={end}&maxrecords={max_records}"
         else:
             # Use timespan
-            self._validate_timespan(timespan)
-            self.query_params.append(f"&timespan={timespan}")
+            self.api_params = {"timespan": timespan, "maxrecords": max_records}
+            suffix = f"&timespan={timespan}&maxrecords={max_records}"
 
-        if num_records > 250:
-            raise ValueError(f"num_records must 250 or less, not {num_records}")
+        # The filters can't change after construction, so build the string once
+        self._query_string = "".join(self.query_params) + suffix
 
-        self.query_params.append(f"&maxrecords={str(num_records)}")
+    @property
+    def query_clause(self) -> str:
+        """
+        The search clause sent as the API's `query` parameter, eg. '"airline" theme:ENV_CLIMATECHANGE'
+        """
+        return "".join(self.query_params).strip()
+
+    @property
+    def params(self) -> Dict[str, str]:
+        """
+        The URL parameters for the API, before URL encoding.
+        """
+        return {"query": self.query_clause, **self.api_params}
 
     @property
     def query_string(self) -> str:
-        return "".join(self.query_params)
+        """
+        A human readable form of the filters, eg.
+        '"airline" &startdatetime=20200301000000&enddatetime=20200302000000&maxrecords=250'
+        """
+        return self._query_string
 
     @staticmethod
     def _filter_to_string(name: str, f: Filter) -> str:
@@ -196,12 +244,14 @@ class Filters:
         str
             The converted filter. Eg. "domain:cnn.com"
         """
-        if type(f) == str:
-            return f"{name}:{f} "
+        prefix = _FILTER_PREFIXES[name]
+
+        if isinstance(f, str):
+            return prefix + f + " "
 
         else:
-            # Build an OR statement
-            return "(" + " OR ".join([f"{name}:{clause}" for clause in f]) + ") "
+            # Build an OR statement, letting the separator carry each clause's "name:" prefix
+            return "(" + prefix + _FILTER_SEPARATORS[name].join(f) + ") "
 
     @staticmethod
     def _keyword_to_string(keywords: Filter) -> str:
@@ -221,17 +271,45 @@ class Filters:
         str
             The converted filter eg. "(airline OR shipping)"
         """
-        if type(keywords) == str:
+        if isinstance(keywords, str):
             return f'"{keywords}" '
 
         else:
-            return (
-                "("
-                + " OR ".join(
-                    [f'"{word}"' if " " in word else word for word in keywords]
-                )
-                + ") "
-            )
+            # Lists are usually all single words, which can be joined without any quoting
+            if not any(" " in word for word in keywords):
+                return "(" + " OR ".join(keywords) + ") "
+
+            # str.join builds a list from any iterable first, so pass it a list directly
+            quoted = [f'"{word}"' if " " in word else word for word in keywords]
+            return f'({" OR ".join(quoted)}) '
+
+    @staticmethod
+    def _date_to_datetime(date: str) -> str:
+        """
+        Convert a date into the datetime format needed for the API.
+        Raises a `ValueError` if the date isn't in YYYY-MM-DD (or YYYYMMDD) format.
+
+        Params
+        ------
+        date
+            The date to convert
+
+        Returns
+        -------
+        str
+            The converted date, eg. "20200501000000"
+        """
+        match = _DATE_RE.fullmatch(date)
+        if match is None:
+            raise ValueError(f"Date {date} is invalid. Dates must be in YYYY-MM-DD format")
+
+        year, _, month, day = match.groups()
+        try:
+            _date(int(year), int(month), int(day))
+        except ValueError:
+            raise ValueError(f"Date {date} is invalid. Dates must be in YYYY-MM-DD format") from None
+
+        return year + month + day + "000000"
 
     @staticmethod
     def _validate_timespan(timespan: str) -> None:
@@ -255,14 +333,19 @@ class Filters:
         None
         """
 
-        value = timespan.rstrip(ascii_lowercase)
-        unit = timespan[len(value):]
+        match = _TIMESPAN_RE.fullmatch(timespan)
+
+        if match is None:
+            # Work out which part of the timespan is wrong to give a useful error
+            value = timespan.rstrip(ascii_lowercase)
+            unit = timespan[len(value):]
 
-        if unit not in VALID_TIMESPAN_UNITS:
-            raise ValueError(f"Timespan {timespan} is invalid. {unit} is not a supported unit, must be one of {' '.join(VALID_TIMESPAN_UNITS)}")
+            if unit not in _VALID_UNITS:
+                raise ValueError(f"Timespan {timespan} is invalid. {unit} is not a supported unit, must be one of {' '.join(VALID_TIMESPAN_UNITS)}")
 
-        if not all(d in digits for d in value):
             raise ValueError(f"Timespan {timespan} is invalid. {value} could not be converted into an integer")
 
+        value, unit = match.groups()
+
         if unit == "min" and int(value) < 60:
             raise ValueError(f"Timespan {timespan} is invalid. Period must be at least 60 minutes")
@@ -1,29 +1,151 @@
 import json
 
+from operator import attrgetter
+from typing import Dict, List, Optional, Union
 
-def load_json(json_message, max_recursion_depth: int = 100, recursion_depth: int = 0):
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+ARTICLE_COLUMNS = (
+    "url",
+    "url_mobile",
+    "title",
+    "seendate",
+    "socialimage",
+    "domain",
+    "language",
+    "sourcecountry",
+)
+
+if msgspec is not None:
+    class _Article(msgspec.Struct):
+        url: Optional[str] = None
+        url_mobile: Optional[str] = None
+        title: Optional[str] = None
+        seendate: Optional[str] = None
+        socialimage: Optional[str] = None
+        domain: Optional[str] = None
+        language: Optional[str] = None
+        sourcecountry: Optional[str] = None
+
+    class _ArticleList(msgspec.Struct):
+        articles: Optional[List[_Article]] = None
+
+    _article_list_decoder = msgspec.json.Decoder(_ArticleList)
+
+
+def load_json(json_message: Union[bytes, str], max_recursion_depth: int = 100):
     """
     tries to load a json formatted string and removes offending characters if present
     https://stackoverflow.com/questions/37805751/simplejson-scanner-jsondecodeerror-invalid-x-escape-sequence-us-line-1-colu
 
-    :param json_message:
-    :param max_recursion_depth:
-    :param recursion_depth:
-    :return:
+    :param json_message: the raw message, as bytes or a string
+    :param max_recursion_depth: the maximum number of offending characters to remove
+    :return: the parsed message
     """
-    try:
-        result = json.loads(json_message)
-    except Exception as e:
-        if recursion_depth >= max_recursion_depth:
+    if orjson is not None:
+        return _load_json_orjson(json_message, max_recursion_depth)
+    return _load_json_stdlib(json_message, max_recursion_depth)
+
+
+def _load_json_orjson(json_message: Union[bytes, str], max_recursion_depth: int):
+    """
+    `load_json` using orjson, which parses the repaired bytearray in place on every pass.
+    """
+    buffer = json_message
+    text = None
+    repairs = 0
+
+    while True:
+        try:
+            return orjson.loads(buffer)
+        except orjson.JSONDecodeError as e:
+            pos = e.pos
+
+        if repairs >= max_recursion_depth:
             raise ValueError("Max Recursion depth is reached. JSON can´t be parsed!")
-        # Find the offending character index:
-        idx_to_replace = int(e.pos)
-        # Remove the offending character:
-        if isinstance(json_message, bytes):
-            json_message.decode("utf-8")
-        json_message = list(json_message)
-        json_message[idx_to_replace] = ' '
-        new_message = ''.join(str(m) for m in json_message)
-        return load_json(json_message=new_message, max_recursion_depth=max_recursion_depth,
-                         recursion_depth=recursion_depth+1)
-    return result
+
+        if repairs == 0:
+            # Only copy the message once it needs repairing
+            if isinstance(json_message, str):
+                json_message = json_message.encode("utf-8")
+            buffer = bytearray(json_message)
+            # orjson reports character offsets, which are only byte offsets for ASCII messages.
+            # Spaces replace ASCII characters, so the mapping between them never changes.
+            text = None if buffer.isascii() else buffer.decode("utf-8")
+
+        if pos >= (len(buffer) if text is None else len(text)):
+            raise ValueError("JSON can´t be parsed, the message ended unexpectedly")
+
+        if text is not None:
+            pos = len(text[:pos].encode("utf-8"))
+
+        # orjson points at the character after the backslash of an invalid escape,
+        # remove the backslash instead to match the stdlib repair. An even run of
+        # backslashes is made of escaped backslashes, so the error is at `pos` itself.
+        backslashes = 0
+        while pos - backslashes > 0 and buffer[pos - backslashes - 1] == 0x5C:
+            backslashes += 1
+        if backslashes % 2:
+            pos -= 1
+
+        buffer[pos] = 0x20
+        repairs += 1
+
+
+def _load_json_stdlib(json_message: Union[bytes, str], max_recursion_depth: int):
+    """
+    `load_json` using the stdlib json module.
+    """
+    if isinstance(json_message, (bytes, bytearray)):
+        json_message = json_message.decode("utf-8")
+    repairs = 0
+
+    while True:
+        try:
+            return json.loads(json_message)
+        except json.JSONDecodeError as e:
+            pos = e.pos
+
+        if repairs >= max_recursion_depth:
+            raise ValueError("Max Recursion depth is reached. JSON can´t be parsed!")
+
+        if pos >= len(json_message):
+            raise ValueError("JSON can´t be parsed, the message ended unexpectedly")
+
+        json_message = json_message[:pos] + " " + json_message[pos + 1:]
+        repairs += 1
+
+
+def load_article_columns(json_message: Union[bytes, str], max_recursion_depth: int = 100) -> Optional[Dict[str, list]]:
+    """
+    Load an `ArtList` response straight into one list of values per column in `ARTICLE_COLUMNS`.
+    If msgspec is installed the articles are decoded against their known schema, which skips
+    building a dict per article. Responses that don't match the schema, or aren't valid JSON,
+    are loaded with `load_json` instead.
+
+    :param json_message: the raw message, as bytes or a string
+    :param max_recursion_depth: passed to `load_json` if the message needs repairing
+    :return: a dict of column name to values, or None if the response has no articles
+    """
+    if msgspec is not None:
+        try:
+            articles = _article_list_decoder.decode(json_message).articles
+        except msgspec.DecodeError:
+            pass
+        else:
+            if articles is None:
+                return None
+            return {column: list(map(attrgetter(column), articles)) for column in ARTICLE_COLUMNS}
+
+    articles = load_json(json_message, max_recursion_depth).get("articles")
+    if articles is None:
+        return None
+    return {column: [article.get(column) for article in articles] for column in ARTICLE_COLUMNS}
@@ -1,16 +1,15 @@
 import setuptools
 
-with open("requirements.txt", "r") as f:
-    requirements = [line.replace("\n", "") for line in f.readlines()]
+from pathlib import Path
 
-with open("README.md", "r") as fh:
-    long_description = fh.read()
+requirements = [line for line in Path("requirements.txt").read_text().splitlines() if line]
 
-with open("gdeltdoc/_version.py", "r") as g:
-    version = "1.0.0"
-    for line in g.readlines():
-        if "version" in line:
-            version = line.split("=")[1].replace("\n", "").replace('"', "").replace(" ", "")
+long_description = Path("README.md").read_text()
+
+# Run the version module rather than importing the package, which needs the requirements installed
+about = {}
+exec(Path("gdeltdoc/_version.py").read_text(), about)
+version = about["version"]
 
 setuptools.setup(
     name="gdeltdoc",
@@ -27,6 +26,7 @@ setuptools.setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires='>=3.6',
+    python_requires='>=3.7',
     install_requires=requirements,
+    extras_require={"fast": ["orjson", "msgspec"]},
 )
\ No newline at end of file
@@ -1,7 +1,15 @@
+import json
 import pandas as pd
+import subprocess
+import sys
 import unittest
 
-from gdeltdoc import GdeltDoc, Filters
+from unittest import mock
+from urllib3 import HTTPResponse
+from urllib3.util.retry import Retry
+
+from gdeltdoc import GdeltDoc, Filters, RateLimitError
+from gdeltdoc.api_client import API_URL
 from datetime import datetime, timedelta
 
 
@@ -105,4 +113,238 @@ class QueryTestCase(unittest.TestCase):
 
     def test_handles_invalid_query_string(self):
         with self.assertRaisesRegex(ValueError, "The query was not valid. The API error message was"):
-            GdeltDoc()._query("artlist", "environment&timespan=mins15")
\ No newline at end of file
+            GdeltDoc()._query("artlist", {"query": "environment", "timespan": "mins15"})
+
+
+class SessionTestCase(unittest.TestCase):
+    """
+    Test that the client manages its HTTP session correctly.
+    """
+
+    def test_context_manager_returns_client(self):
+        with GdeltDoc() as gd:
+            self.assertIsInstance(gd, GdeltDoc)
+
+    def test_user_agent_is_set(self):
+        with GdeltDoc() as gd:
+            self.assertTrue(gd._session.headers["User-Agent"].startswith("GDELT DOC Python API client"))
+
+    def test_import_does_not_load_pandas(self):
+        # Run in a fresh interpreter, this one has already imported pandas for the tests
+        result = subprocess.run(
+            [sys.executable, "-c", "import sys, gdeltdoc; print('pandas' in sys.modules)"],
+            capture_output=True, text=True, check=True,
+        )
+        self.assertEqual(result.stdout.strip(), "False")
+
+    def test_retries_rate_limited_requests(self):
+        with GdeltDoc(max_retries=3) as gd:
+            retry = gd._session.get_adapter("https://api.gdeltproject.org").max_retries
+            self.assertEqual(retry.total, 3)
+            self.assertIn(429, retry.status_forcelist)
+
+    def test_retry_backoff_is_jittered(self):
+        with GdeltDoc() as gd:
+            retry = gd._session.get_adapter("https://api.gdeltproject.org").max_retries
+
+        response = HTTPResponse(status=429)
+        for _ in range(3):
+            retry = retry.increment(method="GET", url=API_URL, response=response)
+
+        backoff = Retry.get_backoff_time(retry)
+        self.assertGreater(backoff, 0)
+
+        with mock.patch("urllib3.util.retry.time.sleep") as sleep:
+            for _ in range(20):
+                retry.sleep(response)
+
+        self.assertEqual(sleep.call_count, 20)
+        for call in sleep.call_args_list:
+            self.assertGreaterEqual(call.args[0], backoff)
+            self.assertLessEqual(call.args[0], 2 * backoff)
+
+    def test_rate_limited_request_raises(self):
+        with GdeltDoc() as gd:
+            gd._session.get = mock.Mock(return_value=mock.Mock(
+                status_code=429, text="Please limit requests to one every 5 seconds",
+            ))
+
+            with self.assertRaises(RateLimitError):
+                gd._query("artlist", Filters(keyword="environment", timespan="1d").params)
+
+
+class TimelineParsingTestCase(unittest.TestCase):
+    """
+    Test that timeline responses are turned into DataFrames correctly, without calling the API.
+    """
+
+    def setUp(self):
+        self.filters = Filters(keyword="environment", timespan="1d")
+
+    def timeline_search(self, mode, timeline):
+        with mock.patch.object(GdeltDoc, "_query", return_value={"timeline": timeline}):
+            return GdeltDoc().timeline_search(mode, self.filters)
+
+    def test_multiple_series(self):
+        result = self.timeline_search("timelinelang", [
+            {"series": "English", "data": [{"date": "20230101T000000Z", "value": 0.5},
+                                           {"date": "20230101T001500Z", "value": 0.25}]},
+            {"series": "French", "data": [{"date": "20230101T000000Z", "value": 0.1},
+                                          {"date": "20230101T001500Z", "value": 0.2}]},
+        ])
+        self.assertEqual(list(result.columns), ["datetime", "English", "French"])
+        self.assertEqual(list(result["French"]), [0.1, 0.2])
+        self.assertEqual(result["datetime"][1], pd.Timestamp("2023-01-01 00:15:00", tz="UTC"))
+
+    def test_series_of_different_lengths(self):
+        english = {"series": "English", "data": [{"date": "20230101T000000Z", "value": 0.5},
+                                                 {"date": "20230101T001500Z", "value": 0.25},
+                                                 {"date": "20230101T003000Z", "value": 0.75}]}
+        french = {"series": "French", "data": [{"date": "20230101T000000Z", "value": 0.1}]}
+
+        for timeline in [[english, french], [french, english]]:
+            with self.assertRaisesRegex(ValueError, "All arrays must be of the same length"):
+                self.timeline_search("timelinelang", timeline)
+
+    def test_vol_raw_includes_all_articles(self):
+        result = self.timeline_search("timelinevolraw", [
+            {"series": "Article Count", "data": [{"date": "20230101T000000Z", "value": 3, "norm": 100},
+                                                 {"date": "20230101T001500Z", "value": 4, "norm": 120}]},
+        ])
+        self.assertEqual(list(result.columns), ["datetime", "Article Count", "All Articles"])
+        self.assertEqual(list(result["Article Count"]), [3, 4])
+        self.assertEqual(list(result["All Articles"]), [100, 120])
+        self.assertEqual(result["Article Count"].dtype, "int64")
+
+    def test_vol_raw_with_null_values(self):
+        result = self.timeline_search("timelinevolraw", [
+            {"series": "Article Count", "data": [{"date": "20230101T000000Z", "value": 3, "norm": 100},
+                                                 {"date": "20230101T001500Z", "value": None, "norm": 120}]},
+        ])
+        self.assertEqual(result["Article Count"][0], 3)
+        self.assertTrue(pd.isna(result["Article Count"][1]))
+        self.assertEqual(list(result["All Articles"]), [100, 120])
+
+    def test_null_values(self):
+        result = self.timeline_search("timelinetone", [
+            {"series": "Average Tone", "data": [{"date": "20230101T000000Z", "value": None},
+                                                {"date": "20230101T001500Z", "value": -1.5}]},
+        ])
+        self.assertTrue(pd.isna(result["Average Tone"][0]))
+        self.assertEqual(result["Average Tone"][1], -1.5)
+
+    def test_no_series(self):
+        self.assertTrue(self.timeline_search("timelinevol", []).empty)
+
+
+class ArticleParsingTestCase(unittest.TestCase):
+    """
+    Test that article list responses are turned into DataFrames correctly, without calling the API.
+    """
+
+    def article_search(self, response):
+        with mock.patch.object(GdeltDoc, "_request", return_value=json.dumps(response).encode("utf-8")):
+            return GdeltDoc().article_search(Filters(keyword="environment", timespan="1d"))
+
+    def test_articles(self):
+        result = self.article_search({"articles": [
+            {"url": "https://example.com/a", "title": "A", "seendate": "20230101T120000Z", "language": "English"},
+            {"url": "https://example.com/b", "title": "B", "seendate": "20230102T000000Z", "language": "French"},
+        ]})
+        self.assertEqual(list(result.columns), [
+            "url", "url_mobile", "title", "seendate", "socialimage", "domain", "language", "sourcecountry",
+        ])
+        self.assertEqual(list(result["language"]), ["English", "French"])
+        self.assertEqual(result["seendate"][0], pd.Timestamp("2023-01-01 12:00:00", tz="UTC"))
+
+    def test_no_articles(self):
+        self.assertTrue(self.article_search({}).empty)
+
+    def test_empty_article_list_has_utc_seendate(self):
+        result = self.article_search({"articles": []})
+        self.assertTrue(result.empty)
+        self.assertEqual(str(result["seendate"].dt.tz), "UTC")
+
+    def test_article_search_many_keeps_order(self):
+        filters = [Filters(keyword=keyword, timespan="1d") for keyword in ["airline", "airport", "aviation"]]
+
+        def request(mode, params):
+            return json.dumps({"articles": [{"title": params["query"], "seendate": "20230101T120000Z"}]}).encode("utf-8")
+
+        with mock.patch.object(GdeltDoc, "_request", side_effect=request):
+            results = GdeltDoc().article_search_many(filters, concurrency=2)
+
+        self.assertEqual([result["title"][0] for result in results], ['"airline"', '"airport"', '"aviation"'])
+
+    def test_article_search_many_failures(self):
+        filters = [Filters(keyword=keyword, timespan="1d") for keyword in ["airline", "airport"]]
+
+        def request(mode, params):
+            if params["query"] == '"airport"':
+                raise RateLimitError("Rate limited")
+            return json.dumps({"articles": [{"title": params["query"], "seendate": "20230101T120000Z"}]}).encode("utf-8")
+
+        with mock.patch.object(GdeltDoc, "_request", side_effect=request):
+            with self.assertRaises(RateLimitError):
+                GdeltDoc().article_search_many(filters)
+
+            results = GdeltDoc().article_search_many(filters, return_exceptions=True)
+
+        self.assertEqual(results[0]["title"][0], '"airline"')
+        self.assertIsInstance(results[1], RateLimitError)
+
+    def test_article_search_many_cancels_queued_searches_after_a_failure(self):
+        filters = [Filters(keyword="airline", timespan="1d")] * 20
+
+        with mock.patch.object(GdeltDoc, "_request", side_effect=RateLimitError("Rate limited")) as request:
+            with self.assertRaises(RateLimitError):
+                GdeltDoc().article_search_many(filters, concurrency=2)
+
+        # Searches already running when the first one fails still finish
+        self.assertLessEqual(request.call_count, 4)
+
+
+class CacheTestCase(unittest.TestCase):
+    """
+    Test that repeated queries are answered from the cache.
+    """
+
+    def setUp(self):
+        self.response = mock.Mock(
+            status_code=200,
+            headers={"content-type": "application/json; charset=utf-8"},
+            content=b'{"articles": []}',
+        )
+        dates = {"startdatetime": "20230101000000", "enddatetime": "20230102000000"}
+        self.environment = {"query": "environment", **dates}
+        self.climate = {"query": "climate", **dates}
+
+    def test_repeated_query_uses_cache(self):
+        gd = GdeltDoc()
+        with mock.patch.object(gd._session, "get", return_value=self.response) as get:
+            gd._query("artlist", self.environment)
+            gd._query("artlist", self.environment)
+        self.assertEqual(get.call_count, 1)
+
+    def test_least_recently_used_query_is_evicted(self):
+        gd = GdeltDoc(cache_size=1)
+        with mock.patch.object(gd._session, "get", return_value=self.response) as get:
+            gd._query("artlist", self.environment)
+            gd._query("artlist", self.climate)
+            gd._query("artlist", self.environment)
+        self.assertEqual(get.call_count, 3)
+
+    def test_clear_cache(self):
+        gd = GdeltDoc()
+        with mock.patch.object(gd._session, "get", return_value=self.response) as get:
+            gd._query("artlist", self.environment)
+            gd.clear_cache()
+            gd._query("artlist", self.environment)
+        self.assertEqual(get.call_count, 2)
+
+    def test_timespan_query_is_not_cached(self):
+        gd = GdeltDoc()
+        with mock.patch.object(gd._session, "get", return_value=self.response) as get:
+            gd._query("artlist", {"query": "environment", "timespan": "15min"})
+            gd._query("artlist", {"query": "environment", "timespan": "15min"})
+        self.assertEqual(get.call_count, 2)
@@ -0,0 +1,39 @@
+from gdeltdoc.errors import (
+    raise_response_error,
+    BadRequestError,
+    NotFoundError,
+    RateLimitError,
+    ClientRequestError,
+    ServerError,
+)
+
+from unittest import mock
+import unittest
+
+
+class RaiseResponseErrorTestCase(unittest.TestCase):
+    """
+    Test that `raise_response_error` raises the right exception for each status code.
+    """
+    def check_raises(self, status_code, error):
+        response = mock.Mock(status_code=status_code, text="Error message")
+        with self.assertRaisesRegex(error, "non-successful statuscode. This is the response message: Error message"):
+            raise_response_error(response)
+
+    def test_success_does_not_raise(self):
+        for status_code in [200, 202]:
+            raise_response_error(mock.Mock(status_code=status_code))
+
+    def test_specific_status_codes(self):
+        self.check_raises(400, BadRequestError)
+        self.check_raises(404, NotFoundError)
+        self.check_raises(429, RateLimitError)
+
+    def test_other_client_errors(self):
+        self.check_raises(403, ClientRequestError)
+
+    def test_server_errors(self):
+        self.check_raises(503, ServerError)
+
+    def test_errors_are_value_errors(self):
+        self.check_raises(429, ValueError)
@@ -24,18 +24,76 @@ class FiltersTestCase(unittest.TestCase):
                          '(airline OR climate) &startdatetime=20200513000000&'
                          'enddatetime=20200514000000&maxrecords=250')
 
+    def test_multiple_keywords_and_keyphrases(self):
+        f = Filters(keyword=["airline", "climate change"], start_date = "2020-05-13", end_date = "2020-05-14")
+        self.assertEqual(f.query_clause, '(airline OR "climate change")')
+
     def test_multiple_themes(self):
         f = Filters(theme=["ENV_CLIMATECHANGE", "LEADER"], start_date="2020-05-13", end_date="2020-05-14")
         self.assertEqual(f.query_string,
                          '(theme:ENV_CLIMATECHANGE OR theme:LEADER) &startdatetime=20200513000000&'
                          'enddatetime=20200514000000&maxrecords=250')
 
+    def test_multiple_domains(self):
+        f = Filters(domain=["bbc.co.uk", "nytimes.com", "cnn.com"], start_date="2020-05-13", end_date="2020-05-14")
+        self.assertEqual(f.query_clause, "(domain:bbc.co.uk OR domain:nytimes.com OR domain:cnn.com)")
+
     def test_theme_and_keyword(self):
         f = Filters(keyword="airline", theme="ENV_CLIMATECHANGE", start_date="2020-05-13", end_date="2020-05-14")
         self.assertEqual(f.query_string,
                          '"airline" theme:ENV_CLIMATECHANGE &startdatetime=20200513000000&'
                          'enddatetime=20200514000000&maxrecords=250')
 
+    def test_dates_without_dashes(self):
+        f = Filters(keyword="airline", start_date="20200301", end_date="20200302")
+        self.assertEqual(f.query_string,
+                         '"airline" &startdatetime=20200301000000&enddatetime=20200302000000&maxrecords=250')
+
+    def test_invalid_date(self):
+        with self.assertRaisesRegex(ValueError, "Dates must be in YYYY-MM-DD format"):
+            Filters(keyword="airline", start_date="2020-3-1", end_date="2020-03-02")
+
+    def test_badly_formatted_dates(self):
+        for date in ["2020-0301", "-2020-03-01-", "2020--0301", "2020-03-01 ", "２０２０-03-01"]:
+            with self.subTest(date=date):
+                with self.assertRaisesRegex(ValueError, "Dates must be in YYYY-MM-DD format"):
+                    Filters(keyword="airline", start_date=date, end_date="2020-03-02")
+
+    def test_impossible_dates(self):
+        for date in ["2020-13-45", "2020-00-10", "2021-02-29", "20200431"]:
+            with self.subTest(date=date):
+                with self.assertRaisesRegex(ValueError, "Dates must be in YYYY-MM-DD format"):
+                    Filters(keyword="airline", start_date="2020-03-01", end_date=date)
+
+    def test_missing_end_date(self):
+        with self.assertRaisesRegex(ValueError, "Must provide both start_date and end_date"):
+            Filters(keyword="airline", start_date="2020-03-01")
+
+    def test_dates_and_timespan(self):
+        with self.assertRaisesRegex(ValueError, "Can only provide either start_date and end_date, or timespan"):
+            Filters(keyword="airline", start_date="2020-03-01", timespan="1d")
+
+    def test_too_many_records(self):
+        with self.assertRaisesRegex(ValueError, "num_records must 250 or less"):
+            Filters(keyword="airline", timespan="1d", num_records=251)
+
+    def test_uses_slots(self):
+        f = Filters(keyword="airline", timespan="1d")
+        self.assertFalse(hasattr(f, "__dict__"))
+
+    def test_params(self):
+        f = Filters(keyword="airline", theme="ENV_CLIMATECHANGE", start_date="2020-05-13", end_date="2020-05-14")
+        self.assertEqual(f.params, {
+            "query": '"airline" theme:ENV_CLIMATECHANGE',
+            "startdatetime": "20200513000000",
+            "enddatetime": "20200514000000",
+            "maxrecords": "250",
+        })
+
+    def test_params_with_timespan(self):
+        f = Filters(keyword="AT&T", timespan="24h", num_records=50)
+        self.assertEqual(f.params, {"query": '"AT&T"', "timespan": "24h", "maxrecords": "50"})
+
 
 class NearTestCast(unittest.TestCase):
     """
@@ -74,6 +132,10 @@ class MultiRepeatTestCase(unittest.TestCase):
     def test_multi_repeat_or(self):
         self.assertEqual(multi_repeat([(2, "airline"), (3, "airport")], "OR"), '(repeat2:"airline" OR repeat3:"airport" )')
 
+    def test_multi_repeat_checks_single_words(self):
+        with self.assertRaisesRegex(ValueError, "single word"):
+            multi_repeat([(2, "airline"), (3, "climate change")], "AND")
+
     def test_multi_repeat_checks_method(self):
         with self.assertRaisesRegex(ValueError, "method must be one of AND or OR"):
             multi_repeat([(2, "airline"), (3, "airport")], "NOT_A_METHOD")
@@ -99,6 +161,10 @@ class TimespanTestCase(unittest.TestCase):
             with self.assertRaises(ValueError):
                 Filters._validate_timespan(timespan)
 
+    def test_forbids_missing_values(self):
+        with self.assertRaisesRegex(ValueError, "could not be converted into an integer"):
+            Filters._validate_timespan("days")
+
     def test_forbids_incorrectly_formatted_timespans(self):
         with self.assertRaisesRegex(ValueError, "is not a supported unit"):
             Filters._validate_timespan(f"min15")
@@ -0,0 +1,87 @@
+from gdeltdoc import helpers
+from gdeltdoc.helpers import load_json, load_article_columns
+
+from unittest import mock
+import unittest
+
+
+class LoadJsonTestCase(unittest.TestCase):
+    """
+    Test that `load_json` parses API responses, repairing them if needed.
+    """
+    def test_valid_json(self):
+        self.assertEqual(load_json(b'{"articles": [{"title": "A"}]}'), {"articles": [{"title": "A"}]})
+
+    def test_removes_invalid_escapes(self):
+        self.assertEqual(load_json(b'{"title": "A \\x B \\q"}'), {"title": "A  x B  q"})
+
+    def test_keeps_non_ascii_characters(self):
+        self.assertEqual(
+            load_json('{"title": "Café \\x Zürich"}'.encode("utf-8")),
+            {"title": "Café  x Zürich"},
+        )
+
+    def test_repairs_after_non_ascii_characters(self):
+        self.assertEqual(
+            load_json('{"title": "Zürich \\x", "domain": "bücher.de \\q \tend"}'.encode("utf-8")),
+            {"title": "Zürich  x", "domain": "bücher.de  q  end"},
+        )
+
+    def test_keeps_escaped_backslashes(self):
+        self.assertEqual(load_json(b'{"title": "a\\\\\tb"}'), {"title": "a\\ b"})
+        self.assertEqual(load_json(b'{"title": "a\\\\\\x"}', max_recursion_depth=1), {"title": "a\\ x"})
+
+    def test_does_not_modify_the_message(self):
+        message = bytearray(b'{"title": "A \\x"}')
+        load_json(message)
+        self.assertEqual(message, bytearray(b'{"title": "A \\x"}'))
+
+    def test_accepts_strings(self):
+        self.assertEqual(load_json('{"title": "A \\x"}'), {"title": "A  x"})
+
+    def test_max_recursion_depth(self):
+        with self.assertRaisesRegex(ValueError, "Max Recursion depth is reached"):
+            load_json(b'{"title": "\\x \\x \\x"}', max_recursion_depth=2)
+
+    def test_repairs_more_characters_than_the_recursion_limit(self):
+        message = b'{"title": "' + b"\\x" * 1500 + b'"}'
+        self.assertEqual(load_json(message, max_recursion_depth=1500), {"title": " x" * 1500})
+
+    def test_truncated_message(self):
+        with self.assertRaisesRegex(ValueError, "ended unexpectedly"):
+            load_json(b'{"title": "A"')
+
+
+class LoadJsonWithoutOrjsonTestCase(LoadJsonTestCase):
+    """
+    Run the `load_json` tests again using the stdlib json fallback.
+    """
+    def setUp(self):
+        patcher = mock.patch.object(helpers, "orjson", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class LoadArticleColumnsTestCase(unittest.TestCase):
+    """
+    Test that `load_article_columns` returns the same columns with and without msgspec.
+    """
+    message = (
+        b'{"articles": [{"url": "https://example.com/a", "title": "A \\x", "seendate": "20230101T120000Z"},'
+        b' {"url": "https://example.com/b", "title": "B", "language": "French"}]}'
+    )
+
+    def check_columns(self):
+        columns = load_article_columns(self.message)
+        self.assertEqual(tuple(columns), helpers.ARTICLE_COLUMNS)
+        self.assertEqual(columns["title"], ["A  x", "B"])
+        self.assertEqual(columns["language"], [None, "French"])
+        self.assertEqual(load_article_columns(b'{"articles": [{"title": "C"}]}')["title"], ["C"])
+        self.assertIsNone(load_article_columns(b"{}"))
+
+    def test_columns(self):
+        self.check_columns()
+
+    def test_columns_without_msgspec(self):
+        with mock.patch.object(helpers, "msgspec", None):
+            self.check_columns()